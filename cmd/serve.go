@@ -0,0 +1,150 @@
+package cmd
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"sync"
+
+	"github.com/spf13/cobra"
+	"github.com/spf13/pflag"
+)
+
+var serveCmd = &cobra.Command{
+	Use:   "serve",
+	Short: "Run commands from newline-delimited JSON on stdin",
+	Long: `Run as a long-lived process that reads one JSON request per line from stdin
+and writes one JSON response per line to stdout, so client libraries can run many
+commands without paying process startup for each one.
+
+Request:  {"args": ["status", "--build-id", "build_456", "--output", "json"]}
+Response: {"exit_code": 0, "stdout": "...", "stderr": "..."}`,
+	Args: cobra.NoArgs,
+	RunE: runServe,
+}
+
+type serveRequest struct {
+	Args []string `json:"args"`
+}
+
+type serveResponse struct {
+	ExitCode int    `json:"exit_code"`
+	Stdout   string `json:"stdout"`
+	Stderr   string `json:"stderr"`
+}
+
+const serveMaxRequestBytes = 16 * 1024 * 1024
+
+func init() {
+	rootCmd.AddCommand(serveCmd)
+}
+
+func runServe(cmd *cobra.Command, args []string) error {
+	_ = cmd
+	_ = args
+
+	in := bufio.NewScanner(os.Stdin)
+	in.Buffer(make([]byte, 64*1024), serveMaxRequestBytes)
+
+	// Keep a handle on the real stdout; served commands temporarily replace os.Stdout.
+	enc := json.NewEncoder(os.Stdout)
+	enc.SetEscapeHTML(false)
+
+	for in.Scan() {
+		line := bytes.TrimSpace(in.Bytes())
+		if len(line) == 0 {
+			continue
+		}
+
+		var req serveRequest
+		var resp serveResponse
+		if err := json.Unmarshal(line, &req); err != nil {
+			resp = serveResponse{ExitCode: 1, Stderr: fmt.Sprintf("invalid serve request: %v\n", err)}
+		} else if len(req.Args) > 0 && req.Args[0] == "serve" {
+			resp = serveResponse{ExitCode: 1, Stderr: "serve cannot be nested\n"}
+		} else {
+			resp = executeServed(req.Args)
+		}
+
+		if err := enc.Encode(resp); err != nil {
+			return newCLIError("output_error", "failed to write serve response", 1, err)
+		}
+	}
+	if err := in.Err(); err != nil {
+		return newCLIError("input_error", "failed to read serve request", 1, err)
+	}
+	return nil
+}
+
+// executeServed runs a single command line in-process, capturing everything it
+// writes to stdout/stderr along with the exit code it would have returned.
+func executeServed(args []string) serveResponse {
+	outR, outW, err := os.Pipe()
+	if err != nil {
+		return serveResponse{ExitCode: 1, Stderr: fmt.Sprintf("failed to capture stdout: %v\n", err)}
+	}
+	errR, errW, err := os.Pipe()
+	if err != nil {
+		outR.Close()
+		outW.Close()
+		return serveResponse{ExitCode: 1, Stderr: fmt.Sprintf("failed to capture stderr: %v\n", err)}
+	}
+
+	var stdout, stderr bytes.Buffer
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		_, _ = io.Copy(&stdout, outR)
+	}()
+	go func() {
+		defer wg.Done()
+		_, _ = io.Copy(&stderr, errR)
+	}()
+
+	origArgs, origStdout, origStderr := os.Args, os.Stdout, os.Stderr
+	os.Args = append([]string{origArgs[0]}, args...)
+	os.Stdout, os.Stderr = outW, errW
+
+	exitCode := runServed(args)
+
+	os.Args, os.Stdout, os.Stderr = origArgs, origStdout, origStderr
+	outW.Close()
+	errW.Close()
+	wg.Wait()
+	outR.Close()
+	errR.Close()
+
+	return serveResponse{ExitCode: exitCode, Stdout: stdout.String(), Stderr: stderr.String()}
+}
+
+// runServed executes args on rootCmd. A panic in the command is reported as
+// an error response instead of taking down the whole serve process.
+func runServed(args []string) (exitCode int) {
+	defer func() {
+		if r := recover(); r != nil {
+			exitCode = HandleError(newCLIError("internal_error", fmt.Sprintf("command panicked: %v", r), 1, nil))
+		}
+	}()
+
+	resetFlags(rootCmd)
+	rootCmd.SetArgs(args)
+	return HandleError(rootCmd.Execute())
+}
+
+// resetFlags restores every flag to its default so values from one served
+// command never leak into the next.
+func resetFlags(cmd *cobra.Command) {
+	reset := func(f *pflag.Flag) {
+		_ = f.Value.Set(f.DefValue)
+		f.Changed = false
+	}
+	cmd.PersistentFlags().VisitAll(reset)
+	cmd.Flags().VisitAll(reset)
+	for _, child := range cmd.Commands() {
+		resetFlags(child)
+	}
+}
@@ -0,0 +1,87 @@
+package cmd
+
+import (
+	"fmt"
+	"os"
+	"strings"
+	"testing"
+
+	"github.com/spf13/cobra"
+)
+
+func TestExecuteServedResetsFlagsBetweenRequests(t *testing.T) {
+	t.Setenv("HOME", t.TempDir())
+
+	var value string
+	probe := &cobra.Command{
+		Use: "serve-probe",
+		RunE: func(cmd *cobra.Command, args []string) error {
+			fmt.Fprintf(os.Stdout, "value=%s output=%s", value, outputFormat)
+			return nil
+		},
+	}
+	probe.Flags().StringVar(&value, "value", "default", "probe value")
+	rootCmd.AddCommand(probe)
+	defer rootCmd.RemoveCommand(probe)
+
+	first := executeServed([]string{"serve-probe", "--value", "first", "--json"})
+	if first.ExitCode != 0 {
+		t.Fatalf("first request exit code = %d, stderr = %q", first.ExitCode, first.Stderr)
+	}
+	if want := "value=first output=json"; first.Stdout != want {
+		t.Fatalf("first request stdout = %q, want %q", first.Stdout, want)
+	}
+
+	second := executeServed([]string{"serve-probe"})
+	if second.ExitCode != 0 {
+		t.Fatalf("second request exit code = %d, stderr = %q", second.ExitCode, second.Stderr)
+	}
+	if want := "value=default output=text"; second.Stdout != want {
+		t.Fatalf("second request stdout = %q, want %q (flags leaked from the first request)", second.Stdout, want)
+	}
+}
+
+func TestExecuteServedCapturesExitCodeAndStderr(t *testing.T) {
+	t.Setenv("HOME", t.TempDir())
+
+	resp := executeServed([]string{"status", "--json"})
+	if resp.ExitCode != 1 {
+		t.Fatalf("exit code = %d, want 1", resp.ExitCode)
+	}
+	if resp.Stdout != "" {
+		t.Fatalf("stdout = %q, want empty", resp.Stdout)
+	}
+	if resp.Stderr == "" {
+		t.Fatal("stderr is empty, want the JSON error envelope")
+	}
+}
+
+func TestExecuteServedRecoversFromPanic(t *testing.T) {
+	t.Setenv("HOME", t.TempDir())
+
+	probe := &cobra.Command{
+		Use: "serve-panic",
+		RunE: func(cmd *cobra.Command, args []string) error {
+			panic("boom")
+		},
+	}
+	rootCmd.AddCommand(probe)
+	defer rootCmd.RemoveCommand(probe)
+
+	origStdout, origStderr := os.Stdout, os.Stderr
+	resp := executeServed([]string{"serve-panic", "--json"})
+	if resp.ExitCode != 1 {
+		t.Fatalf("exit code = %d, want 1", resp.ExitCode)
+	}
+	if !strings.Contains(resp.Stderr, "command panicked: boom") {
+		t.Fatalf("stderr = %q, want the panic reported", resp.Stderr)
+	}
+	if os.Stdout != origStdout || os.Stderr != origStderr {
+		t.Fatal("os.Stdout/os.Stderr were not restored after the panic")
+	}
+
+	after := executeServed([]string{"--version"})
+	if after.ExitCode != 0 {
+		t.Fatalf("request after the panic exit code = %d, stderr = %q", after.ExitCode, after.Stderr)
+	}
+}
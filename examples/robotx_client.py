@@ -13,14 +13,47 @@ Usage:
     )
 
     result = client.deploy('./my-app', name='my-app', publish=True)
-    print(f"Deployed to: {result['url']}")
+    print(f"Deployed to: {result['production_url']}")
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import copy
+import hashlib
 import subprocess
 import json
 import os
-from typing import Dict, Any, Optional, List
-from pathlib import Path
+import re
+import shutil
+import threading
+import time
+from typing import Any, ClassVar, Iterator
+
+try:
+    # Optional: noticeably faster on the small payloads polled in loops
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Keyword arguments for every robotx spawn. Without close_fds, and given an
+# absolute executable, CPython starts the child with posix_spawn() instead
+# of fork()+exec() where supported. This avoids copying the parent's page
+# tables, which can be large for long-running agents. Leaking descriptors
+# is not a concern: since PEP 446 they are non-inheritable unless a
+# caller opts in.
+_SPAWN_OPTIONS: dict[str, Any] = {'close_fds': False}
+
+# RobotXAPIError messages worth retrying: the request never got an answer
+# ("request failed: ...") or the server failed ("API error (status 5xx)")
+_TRANSIENT_ERROR = re.compile(r'request failed|status 5\d\d')
+
+# Appended to every command: machine-readable output on stdout, with
+# progress lines moved to stderr ahead of any error envelope
+_JSON_OUTPUT = ('--output', 'json')
 
 
 class RobotXError(Exception):
@@ -38,6 +71,128 @@ class RobotXAPIError(RobotXError):
     pass
 
 
+class _ServeExited(RobotXError):
+    """Raised when `robotx serve` dies before answering a request"""
+    pass
+
+
+class _PollBackoff:
+    """
+    Poll delays that grow while a build's status stays the same
+    """
+
+    __slots__ = ('initial', 'maximum', 'factor', '_interval', '_last_status')
+
+    def __init__(self, initial: float, maximum: float, factor: float):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self._interval = initial
+        self._last_status: str | None = None
+
+    def next_delay(self, build_status: str | None) -> float:
+        # A transition (e.g. queued -> running) often precedes another one
+        if build_status != self._last_status:
+            self._last_status = build_status
+            self._interval = self.initial
+
+        delay = self._interval
+        self._interval = min(self.maximum, self._interval * self.factor)
+        return delay
+
+
+class _ServeProcess:
+    """
+    A `robotx serve` child that runs one command at a time
+    """
+
+    __slots__ = ('_argv', '_env', '_proc', '_lock')
+
+    def __init__(self, executable: str, env: dict[str, str]):
+        self._argv = [executable, 'serve']
+        self._env = env
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def run(self, args: list[str]) -> tuple[int, str, str] | None:
+        """
+        Run one command, starting the process first if needed
+
+        Returns:
+            (exit code, stdout, stderr), or None if `serve` is unsupported
+
+        Raises:
+            _ServeExited: If the process died before answering; the next
+                call starts a new one
+        """
+        with self._lock:
+            if self._proc is None and not self._start():
+                return None
+
+            response = self._roundtrip(args)
+            if response is None:
+                self._stop()
+                raise _ServeExited("robotx serve process exited unexpectedly")
+
+        return response['exit_code'], response['stdout'], response['stderr']
+
+    def close(self) -> None:
+        """
+        Stop the process, if one is running
+        """
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> bool:
+        """
+        Start `robotx serve` and confirm it answers requests
+
+        Returns:
+            False if the installed robotx does not support `serve`
+        """
+        try:
+            self._proc = subprocess.Popen(
+                self._argv,
+                env=self._env,
+                **_SPAWN_OPTIONS,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            raise RobotXError(f"robotx command not found: {self._argv[0]}")
+
+        # Older binaries exit with "unknown command"; nothing has run yet,
+        # so it is safe to fall back to spawning robotx per call.
+        if self._roundtrip(['--version']) is None:
+            self._stop()
+            return False
+        return True
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def _roundtrip(self, args: list[str]) -> dict[str, Any] | None:
+        """
+        Send one request and read its response line
+        """
+        try:
+            self._proc.stdin.write(json.dumps({'args': args}).encode() + b'\n')
+            self._proc.stdin.flush()
+            line = self._proc.stdout.readline()
+        except OSError:
+            return None
+        return _json_loads(line) if line else None
+
+
 class RobotXClient:
     """
     Python client for RobotX CLI
@@ -49,33 +204,256 @@ class RobotXClient:
         base_url: RobotX server base URL
         api_key: API key for authentication
         robotx_path: Path to robotx binary (default: 'robotx')
+        persistent: Send short read-only commands (status, versions,
+            projects) to one long-lived `robotx serve` process instead of
+            spawning robotx per call. deploy/publish never use it, so a
+            long build never blocks other calls. Falls back
+            to per-call processes when the binary does not support `serve`.
+        retry: (max_attempts, backoff) for read-only commands that fail
+            transiently (network errors or 5xx responses); waits backoff,
+            2*backoff, ... in between
+        max_stale: Seconds a cached read-only response may still be
+            returned, marked with 'stale': True, when the command keeps
+            failing transiently (0 disables)
+        autowarm: Call warmup() before returning from the constructor
     """
 
+    __slots__ = (
+        'base_url',
+        'api_key',
+        'robotx_path',
+        'persistent',
+        'retry',
+        'max_stale',
+        '_executable',
+        '_env',
+        '_daemon',
+        '_serve_supported',
+        '_cache',
+    )
+
+    # Seconds a read-only command's response may be reused. Commands not
+    # listed here (deploy, publish, ...) are never cached.
+    _CACHE_TTL: ClassVar[dict[str, float]] = {
+        'status': 2.0,
+        'versions': 10.0,
+        'projects': 10.0,
+    }
+
+    # CLI exit code -> exception raised for it (see README "退出码")
+    _ERROR_MAP: ClassVar[dict[int, type]] = {
+        2: RobotXAPIError,
+        3: RobotXDeploymentError,
+    }
+
+    # robotx_path -> absolute executable, filled by the first client per path
+    _VERIFIED: ClassVar[dict[str, str]] = {}
+
     def __init__(
         self,
-        base_url: Optional[str] = None,
-        api_key: Optional[str] = None,
-        robotx_path: str = 'robotx'
+        base_url: str | None = None,
+        api_key: str | None = None,
+        robotx_path: str = 'robotx',
+        persistent: bool = True,
+        retry: tuple[int, float] = (3, 1.0),
+        max_stale: float = 60.0,
+        autowarm: bool = False
     ):
         self.base_url = base_url or os.getenv('ROBOTX_BASE_URL')
         self.api_key = api_key or os.getenv('ROBOTX_API_KEY')
         self.robotx_path = robotx_path
+        self.persistent = persistent
+        self.retry = retry
+        self.max_stale = max_stale
+        # Connection settings travel as environment variables (read by the
+        # CLI's ROBOTX_* config binding) instead of being appended to argv
+        self._env = dict(os.environ)
+        if self.base_url:
+            self._env['ROBOTX_BASE_URL'] = self.base_url
+        if self.api_key:
+            self._env['ROBOTX_API_KEY'] = self.api_key
+        self._serve_supported: bool | None = None
+        # key -> (expiry, value, generated_at); expired entries are kept
+        # for up to max_stale so they can still be served when the CLI fails
+        self._cache: dict[tuple[str, ...], tuple[float, dict[str, Any], float]] = {}
+
+        # Verify robotx is available (once per path per interpreter). An
+        # absolute executable also lets subprocess use posix_spawn.
+        executable = RobotXClient._VERIFIED.get(robotx_path)
+        if executable is None:
+            executable = shutil.which(robotx_path)
+            if executable is None:
+                raise RobotXError(
+                    f"robotx command not found at: {robotx_path}\n"
+                    "Please install robotx CLI first."
+                )
+            executable = os.path.abspath(executable)
+            RobotXClient._VERIFIED[robotx_path] = executable
+        self._executable = executable
+        # Started on first use
+        self._daemon = _ServeProcess(executable, self._env)
+
+        if autowarm:
+            try:
+                self.warmup()
+            except BaseException:
+                # Nobody gets a handle to close, so stop the serve process here
+                self.close()
+                raise
+
+    def warmup(self) -> dict[str, Any]:
+        """
+        Do one-time setup work up front, before any timed command
+
+        Sends one authenticated `projects` request, which checks the
+        credentials. In persistent mode it also starts the `robotx serve`
+        process and leaves its connection open, so later status,
+        versions and projects calls skip that setup. deploy() and
+        publish() still start their own robotx process and gain nothing.
+
+        Returns:
+            The `data` of the warm-up `projects` response
 
-        # Verify robotx is available
+        Raises:
+            RobotXAPIError: If the server rejects the request
+        """
+        return self._run_command(['projects', '--limit', '1'])
+
+    def verify(self) -> str:
+        """
+        Run `robotx --version` to check that the binary actually works
+
+        Returns:
+            The version line printed by robotx
+
+        Raises:
+            RobotXError: If robotx is missing or fails to run
+        """
         try:
-            self._run_command(['--version'])
+            result = subprocess.run(
+                [self._executable, '--version'],
+                env=self._env,
+                **_SPAWN_OPTIONS,
+                capture_output=True,
+                check=False
+            )
         except FileNotFoundError:
+            raise RobotXError(f"robotx command not found: {self.robotx_path}")
+
+        if result.returncode != 0:
             raise RobotXError(
-                f"robotx command not found at: {robotx_path}\n"
-                "Please install robotx CLI first."
+                f"robotx --version failed: {result.stderr.decode('utf-8', 'replace')}"
+            )
+        return result.stdout.decode('utf-8', 'replace').strip()
+
+    def close(self) -> None:
+        """
+        Stop the persistent robotx process, if one is running
+        """
+        self._daemon.close()
+
+    def __enter__(self) -> RobotXClient:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run_in_daemon(self, args: list[str]) -> tuple[int, str, str] | None:
+        """
+        Run a read-only command through the persistent robotx process
+
+        Returns:
+            (exit code, stdout, stderr), or None if `serve` is unsupported
+        """
+        try:
+            served = self._daemon.run(args)
+        except _ServeExited:
+            # Only read-only commands are served here, so running one again
+            # in a fresh process is safe
+            served = self._daemon.run(args)
+
+        if served is None:
+            self.persistent = False
+            self._serve_supported = False
+        return served
+
+    def cache_clear(self) -> None:
+        """
+        Drop all cached read-only responses
+        """
+        self._cache.clear()
+
+    def _cache_get(self, args: list[str]) -> dict[str, Any] | None:
+        entry = self._cache.get(tuple(args))
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        # Responses are nested; hand out copies so callers can't edit the cache
+        return copy.deepcopy(entry[1])
+
+    def _cache_get_stale(self, args: list[str]) -> dict[str, Any] | None:
+        entry = self._cache.get(tuple(args))
+        if entry is None:
+            return None
+        age = time.monotonic() - entry[2]
+        if age >= self.max_stale:
+            self._cache.pop(tuple(args), None)
+            return None
+        return {**copy.deepcopy(entry[1]), 'stale': True, 'age': age}
+
+    def _cache_put(self, args: list[str], value: dict[str, Any]) -> None:
+        if self._is_read_only(args):
+            now = time.monotonic()
+            self._cache_prune(now)
+            self._cache[tuple(args)] = (
+                now + self._CACHE_TTL[args[0]],
+                copy.deepcopy(value),
+                now,
             )
 
-    def _run_command(self, args: List[str]) -> Dict[str, Any]:
+    def _cache_prune(self, now: float) -> None:
+        """
+        Drop entries that are neither fresh nor usable as stale fallback
+        """
+        # Long-lived clients polling many build IDs would otherwise keep
+        # every response they ever saw
+        for key, (expiry, _, generated_at) in list(self._cache.items()):
+            if now >= expiry and now - generated_at >= self.max_stale:
+                self._cache.pop(key, None)
+
+    def _is_read_only(self, args: list[str]) -> bool:
+        return bool(args) and args[0] in self._CACHE_TTL
+
+    def _attempts(self, args: list[str]) -> int:
+        # Retrying deploy/publish could repeat their side effects
+        return max(1, self.retry[0]) if self._is_read_only(args) else 1
+
+    def _retry_delay(self, attempt: int) -> float:
+        return self.retry[1] * 2 ** (attempt - 1)
+
+    def _cache_invalidate(self, *ids: str) -> None:
+        """
+        Drop cached responses whose arguments mention any of ids
+        """
+        for key in list(self._cache):
+            if any(i in key for i in ids):
+                self._cache.pop(key, None)
+
+    def _run_command(
+        self,
+        args: list[str],
+        fresh: bool = False,
+        first_result: tuple[int, str | bytes, str | bytes] | None = None
+    ) -> dict[str, Any]:
         """
         Run a robotx command and return parsed JSON output
 
         Args:
             args: Command arguments
+            fresh: Skip the cached response; the result is still cached
+                and can still serve as the stale fallback
+            first_result: (exit code, stdout, stderr) already obtained
+                for this command, used as the first attempt instead of
+                running it again
 
         Returns:
             Parsed JSON response
@@ -83,58 +461,272 @@ class RobotXClient:
         Raises:
             RobotXError: If command fails
         """
-        cmd = [self.robotx_path] + args
+        cached = None if fresh else self._cache_get(args)
+        if cached is not None:
+            return cached
+
+        attempts = self._attempts(args)
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(self._retry_delay(attempt))
+            try:
+                if attempt == 0 and first_result is not None:
+                    response = self._parse_result(*first_result)
+                else:
+                    response = self._execute(args)
+            except RobotXAPIError as e:
+                stale = self._recover(args, e, attempt + 1 < attempts)
+                if stale is None:
+                    continue
+                return stale
 
-        # Add global flags if provided
-        if self.base_url:
-            cmd.extend(['--base-url', self.base_url])
-        if self.api_key:
-            cmd.extend(['--api-key', self.api_key])
+            self._cache_put(args, response)
+            return response
+
+    def _recover(
+        self,
+        args: list[str],
+        error: RobotXAPIError,
+        can_retry: bool
+    ) -> dict[str, Any] | None:
+        """
+        Decide how _run_command and its async variant handle a failed attempt
+
+        Returns:
+            None to retry, or the stale cached response to return instead
+
+        Raises:
+            RobotXAPIError: error itself, if it is not transient or no
+                usable stale response is cached
+        """
+        # 4xx answers (bad key, unknown ID) won't change on retry,
+        # and must not be masked by stale data
+        if not _TRANSIENT_ERROR.search(str(error)):
+            raise error
+        if can_retry:
+            return None
+        stale = self._cache_get_stale(args)
+        if stale is None:
+            raise error
+        return stale
+
+    def _execute(self, args: list[str]) -> dict[str, Any]:
+        """
+        Run a command once, bypassing the cache
+        """
+        # Only quick reads share the serialized serve process; a deploy
+        # holding it for a whole build would stall every other call
+        served = None
+        if self.persistent and self._is_read_only(args):
+            served = self._run_in_daemon([*args, *_JSON_OUTPUT])
+        if served is not None:
+            return self._parse_result(*served)
 
         try:
             result = subprocess.run(
-                cmd,
+                (self._executable, *args, *_JSON_OUTPUT),
+                env=self._env,
+                **_SPAWN_OPTIONS,
                 capture_output=True,
-                text=True,
                 check=False
             )
+        except FileNotFoundError:
+            raise RobotXError(f"robotx command not found: {self.robotx_path}")
 
-            if result.returncode == 0:
-                # Success - parse stdout
-                if result.stdout.strip():
-                    return json.loads(result.stdout)
-                return {'success': True}
-            else:
-                # Error - parse stderr
-                try:
-                    error_data = json.loads(result.stderr)
-                    error_msg = error_data.get('error', 'Unknown error')
-                    details = error_data.get('details', '')
-                except json.JSONDecodeError:
-                    error_msg = result.stderr or 'Command failed'
-                    details = ''
-
-                if result.returncode == 3:
-                    raise RobotXDeploymentError(f"{error_msg}\n{details}")
-                elif result.returncode == 2:
-                    raise RobotXAPIError(f"{error_msg}\n{details}")
-                else:
-                    raise RobotXError(f"{error_msg}\n{details}")
+        return self._parse_result(result.returncode, result.stdout, result.stderr)
 
+    async def _run_command_async(self, args: list[str], fresh: bool = False) -> dict[str, Any]:
+        """
+        Async variant of _run_command
+
+        Each call runs in its own robotx process so that concurrent
+        coroutines never queue behind each other on the persistent
+        process.
+        """
+        cached = None if fresh else self._cache_get(args)
+        if cached is not None:
+            return cached
+
+        attempts = self._attempts(args)
+        for attempt in range(attempts):
+            if attempt:
+                await asyncio.sleep(self._retry_delay(attempt))
+            try:
+                response = await self._execute_async(args)
+            except RobotXAPIError as e:
+                stale = self._recover(args, e, attempt + 1 < attempts)
+                if stale is None:
+                    continue
+                return stale
+
+            self._cache_put(args, response)
+            return response
+
+    async def _execute_async(self, args: list[str]) -> dict[str, Any]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self._executable,
+                *args,
+                *_JSON_OUTPUT,
+                env=self._env,
+                **_SPAWN_OPTIONS,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
         except FileNotFoundError:
             raise RobotXError(f"robotx command not found: {self.robotx_path}")
-        except json.JSONDecodeError as e:
-            raise RobotXError(f"Failed to parse command output: {e}")
+
+        stdout, stderr = await proc.communicate()
+        return self._parse_result(proc.returncode, stdout, stderr)
+
+    def _parse_result(
+        self,
+        returncode: int,
+        stdout: str | bytes,
+        stderr: str | bytes
+    ) -> dict[str, Any]:
+        """
+        Turn a robotx exit code and output into a response or exception
+
+        Output may be str (from `robotx serve`) or raw bytes (from a
+        spawned process); bytes are only decoded for plain-text errors.
+        Successful `--output json` responses are unwrapped from their
+        {"success", "command", "data"} envelope.
+
+        Raises:
+            RobotXError: If the command failed or printed invalid JSON
+        """
+        if returncode == 0:
+            # Success - parse stdout
+            if not stdout or stdout.isspace():
+                return {'success': True}
+            try:
+                response = _json_loads(stdout)
+            except json.JSONDecodeError as e:
+                raise RobotXError(f"Failed to parse command output: {e}")
+            if isinstance(response, dict) and 'command' in response and 'success' in response:
+                return response.get('data') or {'success': response['success']}
+            return response
+
+        # Error - the JSON envelope is the last stderr line, after any
+        # progress output. Only a JSON-looking line is parsed, so plain-text
+        # errors never build and unwind a JSONDecodeError.
+        newline = b'\n' if isinstance(stderr, bytes) else '\n'
+        last_line = stderr.rstrip().rsplit(newline, 1)[-1]
+        error_data = None
+        if last_line[:1] in (b'{', '{'):
+            try:
+                error_data = _json_loads(last_line)
+            except json.JSONDecodeError:
+                pass
+
+        if isinstance(error_data, dict):
+            error_msg = error_data.get('error', 'Unknown error')
+            details = error_data.get('details', '')
+            # `--output json` nests them: {"error": {"message": ..., "details": ...}}
+            if isinstance(error_msg, dict):
+                details = error_msg.get('details') or ''
+                error_msg = error_msg.get('message', 'Unknown error')
+        else:
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8', 'replace')
+            error_msg = stderr or 'Command failed'
+            details = ''
+
+        error_cls = self._ERROR_MAP.get(returncode, RobotXError)
+        raise error_cls(f"{error_msg}\n{details}")
+
+    def batch(
+        self,
+        commands: list[list[str]],
+        return_exceptions: bool = False
+    ) -> list[Any]:
+        """
+        Run several robotx commands, paying process startup only once
+
+        Commands run one at a time, in order. Read-only commands use the
+        persistent `robotx serve` process; everything else (deploy,
+        publish, or every command when the client is not persistent)
+        shares one `robotx serve` started for this batch, so a
+        deploy -> status -> publish flow starts the CLI once without a
+        long build holding up other calls. Without `serve` support each
+        command falls back to its own process.
+
+        The batch stops at the first failed command, which is raised;
+        later commands never run. With return_exceptions, every command
+        runs and failures are returned in place instead.
+
+        Args:
+            commands: Argument lists, one per command
+            return_exceptions: Put the RobotXError of a failed command
+                in its result slot instead of raising it
+
+        Returns:
+            One parsed response per command, in order
+
+        Example:
+            >>> first, second = client.batch([
+            ...     ['status', '--build-id', 'build_1'],
+            ...     ['status', '--build-id', 'build_2'],
+            ... ])
+        """
+        # Started on the first command that needs it
+        serve = _ServeProcess(self._executable, self._env)
+        results: list[Any] = []
+        try:
+            for args in commands:
+                try:
+                    results.append(self._run_batched(serve, args))
+                except RobotXError as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+                finally:
+                    if not self._is_read_only(args):
+                        # Later commands must not get responses cached before it ran
+                        self.cache_clear()
+        finally:
+            serve.close()
+
+        return results
+
+    def _run_batched(self, serve: _ServeProcess, args: list[str]) -> dict[str, Any]:
+        """
+        Run one command of a batch, through serve where it applies
+        """
+        if (self.persistent and self._is_read_only(args)) or self._serve_supported is False:
+            return self._run_command(args)
+
+        # Fresh cache hits never reach the CLI, exactly as in _run_command
+        cached = self._cache_get(args)
+        if cached is not None:
+            return cached
+
+        served = None
+        try:
+            served = serve.run([*args, *_JSON_OUTPUT])
+        except _ServeExited:
+            # A deploy or publish may already have taken effect; a read
+            # is simply run again below
+            if not self._is_read_only(args):
+                raise
+        else:
+            if served is None:
+                self._serve_supported = False
+
+        # The served output counts as the first attempt; retries and the
+        # stale fallback then apply as for any command
+        return self._run_command(args, fresh=True, first_result=served)
 
     def deploy(
         self,
         project_path: str,
-        name: Optional[str] = None,
+        name: str | None = None,
         publish: bool = False,
         wait: bool = True,
         timeout: int = 600,
-        visibility: Optional[str] = None
-    ) -> Dict[str, Any]:
+        visibility: str | None = None
+    ) -> dict[str, Any]:
         """
         Deploy a project to RobotX
 
@@ -147,7 +739,8 @@ class RobotXClient:
             visibility: Project visibility (public/private)
 
         Returns:
-            Deployment result with project_id, build_id, url, etc.
+            Deployment result with project_id, build_id, preview_url,
+            production_url (once published), etc.
 
         Raises:
             RobotXDeploymentError: If deployment fails
@@ -156,15 +749,95 @@ class RobotXClient:
         Example:
             >>> client = RobotXClient()
             >>> result = client.deploy('./my-app', name='my-app', publish=True)
-            >>> print(result['url'])
+            >>> print(result['production_url'])
             https://my-app.api.robotx.xin
         """
+        args = self._deploy_args(project_path, name, publish, wait, timeout, visibility)
+
+        try:
+            return self._run_command(args)
+        finally:
+            # The new build changes project status and version lists
+            self.cache_clear()
+
+    async def deploy_async(
+        self,
+        project_path: str,
+        name: str | None = None,
+        publish: bool = False,
+        wait: bool = True,
+        timeout: int = 600,
+        visibility: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Async variant of deploy()
+
+        Example:
+            >>> result = await client.deploy_async('./my-app', name='my-app')
+        """
+        args = self._deploy_args(project_path, name, publish, wait, timeout, visibility)
+
+        try:
+            return await self._run_command_async(args)
+        finally:
+            self.cache_clear()
+
+    async def deploy_many(
+        self,
+        specs: list[dict[str, Any]],
+        max_concurrency: int = 4
+    ) -> list[Any]:
+        """
+        Deploy several projects concurrently
+
+        Args:
+            specs: One dict of deploy() keyword arguments per project
+            max_concurrency: Maximum number of deploys running at once
+                (at least 1)
+
+        Returns:
+            One result per spec, in order. A failed deploy's slot holds
+            its exception instead of a result.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+
+        Example:
+            >>> results = asyncio.run(client.deploy_many([
+            ...     {'project_path': './web', 'name': 'my-web'},
+            ...     {'project_path': './docs', 'name': 'my-docs'},
+            ... ]))
+        """
+        if max_concurrency < 1:
+            # Semaphore(0) would never let a deploy start
+            raise ValueError("'max_concurrency' must be at least 1")
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(spec: dict[str, Any]) -> dict[str, Any]:
+            async with sem:
+                return await self.deploy_async(**spec)
+
+        return await asyncio.gather(*(_one(spec) for spec in specs), return_exceptions=True)
+
+    def _deploy_args(
+        self,
+        project_path: str,
+        name: str | None,
+        publish: bool,
+        wait: bool,
+        timeout: int,
+        visibility: str | None
+    ) -> list[str]:
         # Validate inputs
         if not name:
             raise ValueError("'name' must be provided for deploy")
 
-        project_path = str(Path(project_path).resolve())
-        if not os.path.exists(project_path):
+        project_path = os.path.realpath(project_path)
+        try:
+            os.stat(project_path)
+        except OSError:
+            # Missing, a path through a regular file, or unreadable
             raise ValueError(f"Project path does not exist: {project_path}")
 
         args = ['deploy', project_path]
@@ -179,13 +852,13 @@ class RobotXClient:
         if visibility:
             args.extend(['--visibility', visibility])
 
-        return self._run_command(args)
+        return args
 
     def status(
         self,
-        project_id: Optional[str] = None,
-        build_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+        project_id: str | None = None,
+        build_id: str | None = None
+    ) -> dict[str, Any]:
         """
         Get project or build status
 
@@ -204,6 +877,26 @@ class RobotXClient:
             >>> print(status['status'])
             running
         """
+        return self._run_command(self._status_args(project_id, build_id))
+
+    async def status_async(
+        self,
+        project_id: str | None = None,
+        build_id: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Async variant of status()
+
+        Example:
+            >>> status = await client.status_async(build_id='build_123')
+        """
+        return await self._run_command_async(self._status_args(project_id, build_id))
+
+    def _status_args(
+        self,
+        project_id: str | None,
+        build_id: str | None
+    ) -> list[str]:
         if not project_id and not build_id:
             raise ValueError("Either 'project_id' or 'build_id' must be provided")
 
@@ -214,7 +907,7 @@ class RobotXClient:
         if build_id:
             args.extend(['--build-id', build_id])
 
-        return self._run_command(args)
+        return args
 
     def logs(self, build_id: str) -> str:
         """
@@ -223,7 +916,7 @@ class RobotXClient:
         _ = build_id
         raise RobotXError('RobotX no longer provides remote build logs')
 
-    def publish(self, project_id: str, build_id: str) -> Dict[str, Any]:
+    def publish(self, project_id: str, build_id: str) -> dict[str, Any]:
         """
         Publish a build to production
 
@@ -232,23 +925,26 @@ class RobotXClient:
             build_id: Build ID to publish
 
         Returns:
-            Publish result
+            Publish result with project_id, build_id and production_url
 
         Raises:
             RobotXAPIError: If API call fails
 
         Example:
             >>> result = client.publish('proj_123', 'build_123')
-            >>> print(result['url'])
+            >>> print(result['production_url'])
             https://my-app.api.robotx.xin
         """
-        return self._run_command([
-            'publish',
-            '--project-id', project_id,
-            '--build-id', build_id,
-        ])
-
-    def versions(self, project_id: str, limit: int = 20) -> Dict[str, Any]:
+        try:
+            return self._run_command([
+                'publish',
+                '--project-id', project_id,
+                '--build-id', build_id,
+            ])
+        finally:
+            self._cache_invalidate(project_id, build_id)
+
+    def versions(self, project_id: str, limit: int = 20) -> dict[str, Any]:
         """
         List recent build versions for a project
         """
@@ -259,7 +955,7 @@ class RobotXClient:
             args.extend(['--limit', str(limit)])
         return self._run_command(args)
 
-    def projects(self, limit: int = 50) -> Dict[str, Any]:
+    def projects(self, limit: int = 50) -> dict[str, Any]:
         """
         List projects for the current account
         """
@@ -272,15 +968,20 @@ class RobotXClient:
         self,
         build_id: str,
         timeout: int = 600,
-        poll_interval: int = 5
-    ) -> Dict[str, Any]:
+        poll_interval: float = 1,
+        max_interval: float = 30,
+        backoff_factor: float = 1.5
+    ) -> dict[str, Any]:
         """
         Wait for a build to complete
 
         Args:
             build_id: Build ID to wait for
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds
+            max_interval: Upper bound for the time between status checks
+            backoff_factor: Growth of the interval after each check that
+                sees no status change; it resets when the status changes
 
         Returns:
             Final build status
@@ -293,35 +994,175 @@ class RobotXClient:
             >>> result = client.deploy('./app', name='app', wait=False)
             >>> final_status = client.wait_for_build(result['build_id'])
         """
-        import time
-
-        start_time = time.time()
+        start_time = time.monotonic()
+        backoff = _PollBackoff(poll_interval, max_interval, backoff_factor)
 
         while True:
-            status = self.status(build_id=build_id)
-            build_status = status.get('build', {}).get('status')
+            # Pollers need a real request each time: a cached "no change"
+            # within the TTL would only grow the backoff
+            status = self._run_command(self._status_args(None, build_id), fresh=True)
+            if self._build_finished(status):
+                return status
+
+            elapsed = time.monotonic() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(f"Build did not complete within {timeout}s")
+
+            delay = backoff.next_delay(status.get('build', {}).get('status'))
+            time.sleep(min(delay, timeout - elapsed))
+
+    async def wait_for_build_async(
+        self,
+        build_id: str,
+        timeout: int = 600,
+        poll_interval: float = 1,
+        max_interval: float = 30,
+        backoff_factor: float = 1.5
+    ) -> dict[str, Any]:
+        """
+        Async variant of wait_for_build()
 
-            if build_status in ['success', 'completed']:
+        Prefer this when supervising several builds at once: all of them
+        can be awaited from one event loop instead of one thread each.
+
+        Example:
+            >>> results = await asyncio.gather(
+            ...     client.wait_for_build_async('build_1'),
+            ...     client.wait_for_build_async('build_2'),
+            ... )
+        """
+        start_time = time.monotonic()
+        backoff = _PollBackoff(poll_interval, max_interval, backoff_factor)
+
+        while True:
+            status = await self._run_command_async(
+                self._status_args(None, build_id),
+                fresh=True
+            )
+            if self._build_finished(status):
                 return status
-            elif build_status in ['failed', 'error']:
-                raise RobotXDeploymentError(f"Build failed: {build_status}")
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > timeout:
                 raise TimeoutError(f"Build did not complete within {timeout}s")
 
-            time.sleep(poll_interval)
+            delay = backoff.next_delay(status.get('build', {}).get('status'))
+            await asyncio.sleep(min(delay, timeout - elapsed))
+
+    def _build_finished(self, status: dict[str, Any]) -> bool:
+        """
+        Check a status response for a terminal build state
+
+        Raises:
+            RobotXDeploymentError: If the build failed
+        """
+        build_status = status.get('build', {}).get('status')
+
+        if build_status in ['success', 'completed']:
+            return True
+        elif build_status in ['failed', 'error']:
+            raise RobotXDeploymentError(f"Build failed: {build_status}")
+        return False
 
 
 # Convenience functions for quick usage
 
+# Clients shared by the convenience functions, least recently used first.
+# Keys are (base_url, blake2b(api_key), robotx_path), so the dict keys hold
+# no raw API key; each client still keeps its own key to pass to robotx.
+_CLIENT_POOL: dict[tuple[str | None, bytes | None, str], RobotXClient] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+_CLIENT_POOL_SIZE = 16
+
+# Number of calls currently using each pooled or evicted client, and
+# evicted clients that get closed once their last call finishes
+_CLIENT_USERS: dict[RobotXClient, int] = {}
+_CLIENT_RETIRED: set[RobotXClient] = set()
+
+
+@contextlib.contextmanager
+def _pooled_client(
+    base_url: str | None = None,
+    api_key: str | None = None,
+    robotx_path: str = 'robotx'
+) -> Iterator[RobotXClient]:
+    # Resolve environment defaults first so the key matches what the client uses
+    base_url = base_url or os.getenv('ROBOTX_BASE_URL')
+    api_key = api_key or os.getenv('ROBOTX_API_KEY')
+    key = (
+        base_url,
+        hashlib.blake2b(api_key.encode()).digest() if api_key else None,
+        robotx_path,
+    )
+
+    evicted = []
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.pop(key, None)
+        if client is None:
+            client = RobotXClient(base_url=base_url, api_key=api_key, robotx_path=robotx_path)
+            if len(_CLIENT_POOL) >= _CLIENT_POOL_SIZE:
+                # Evict the least recently used client
+                evicted = _retire([_CLIENT_POOL.pop(next(iter(_CLIENT_POOL)))])
+        # (Re)inserting moves the client to the most recently used end
+        _CLIENT_POOL[key] = client
+        _CLIENT_USERS[client] = _CLIENT_USERS.get(client, 0) + 1
+    for idle in evicted:
+        idle.close()
+
+    try:
+        yield client
+    finally:
+        with _CLIENT_POOL_LOCK:
+            remaining = _CLIENT_USERS.pop(client) - 1
+            if remaining:
+                _CLIENT_USERS[client] = remaining
+                client = None
+            elif client in _CLIENT_RETIRED:
+                _CLIENT_RETIRED.discard(client)
+            else:
+                client = None
+        if client is not None:
+            client.close()
+
+
+def _retire(clients: list[RobotXClient]) -> list[RobotXClient]:
+    """
+    Mark clients removed from the pool; must hold _CLIENT_POOL_LOCK
+
+    Returns:
+        The clients that are idle and can be closed right away. Busy
+        ones are closed by the last call that releases them.
+    """
+    idle = []
+    for client in clients:
+        if client in _CLIENT_USERS:
+            _CLIENT_RETIRED.add(client)
+        else:
+            idle.append(client)
+    return idle
+
+
+def clear_client_pool() -> None:
+    """
+    Close and forget the clients shared by the convenience functions
+
+    Call this after rotating credentials. Clients still running a call
+    are closed when that call finishes.
+    """
+    with _CLIENT_POOL_LOCK:
+        idle = _retire(list(_CLIENT_POOL.values()))
+        _CLIENT_POOL.clear()
+    for client in idle:
+        client.close()
+
+
 def deploy(
     project_path: str,
     name: str,
-    base_url: Optional[str] = None,
-    api_key: Optional[str] = None,
+    base_url: str | None = None,
+    api_key: str | None = None,
     **kwargs
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Quick deploy function
 
@@ -329,16 +1170,16 @@ def deploy(
         >>> from robotx_client import deploy
         >>> result = deploy('./my-app', 'my-app', publish=True)
     """
-    client = RobotXClient(base_url=base_url, api_key=api_key)
-    return client.deploy(project_path, name=name, **kwargs)
+    with _pooled_client(base_url=base_url, api_key=api_key) as client:
+        return client.deploy(project_path, name=name, **kwargs)
 
 
 def status(
-    project_id: Optional[str] = None,
-    build_id: Optional[str] = None,
-    base_url: Optional[str] = None,
-    api_key: Optional[str] = None
-) -> Dict[str, Any]:
+    project_id: str | None = None,
+    build_id: str | None = None,
+    base_url: str | None = None,
+    api_key: str | None = None
+) -> dict[str, Any]:
     """
     Quick status check function
 
@@ -346,8 +1187,8 @@ def status(
         >>> from robotx_client import status
         >>> result = status(project_id='proj_123')
     """
-    client = RobotXClient(base_url=base_url, api_key=api_key)
-    return client.status(project_id=project_id, build_id=build_id)
+    with _pooled_client(base_url=base_url, api_key=api_key) as client:
+        return client.status(project_id=project_id, build_id=build_id)
 
 
 if __name__ == '__main__':
@@ -374,7 +1215,8 @@ if __name__ == '__main__':
         print(f"✅ Deployment successful!")
         print(f"📦 Project ID: {result['project_id']}")
         print(f"🔨 Build ID: {result['build_id']}")
-        print(f"🌐 URL: {result['url']}")
+        # production_url is omitted when the deploy wasn't published
+        print(f"🌐 URL: {result.get('production_url') or result.get('preview_url')}")
 
     except RobotXError as e:
         print(f"❌ Deployment failed: {e}", file=sys.stderr)